@@ -21,14 +21,20 @@ import subprocess
 import threading
 import configparser
 import logging
+import logging.handlers
+import queue
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import collections
+import functools
 import time
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import win32com.client
-import pythoncom
-from win32api import GetFileVersionInfo, LOWORD, HIWORD
+# pywin32 (win32com, pythoncom, win32api) is imported lazily where needed
 
 # ----------------- DEFAULT CONFIGURATION -----------------
 # Switched lang=de to lang=en-US for international use
@@ -38,6 +44,23 @@ DEFAULT_URLS = {
     "Nightly":"https://download.mozilla.org/?product=firefox-nightly-latest-ssl&os=win64&lang=en-US"
 }
 
+# Block size for writing the installer download (1 MiB instead of 8 KiB chunks)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Interval in ms for moving queued log lines into the console window
+LOG_POLL_MS = 100
+
+# Remote version lookups are reused for this many seconds (also across restarts)
+REMOTE_CACHE_TTL = 600
+
+# (connect, read) timeouts in seconds: short for status checks, long for the installer download
+CHECK_TIMEOUT = (2, 3)
+DOWNLOAD_TIMEOUT = (5, 60)
+
+# Precompiled patterns for version parsing
+_RE_NONVER = re.compile(r'[^0-9\.]')
+_RE_RELEASE = re.compile(r'/releases/([0-9]+\.[0-9]+([a-z0-9\.]+)?)')
+
 DEFAULT_HELP_TEXT = """
 Firefox Portable Manager Help
 
@@ -76,54 +99,127 @@ def get_config_path():
 def get_log_path():
     return os.path.join(get_base_dir(), "FirefoxManager_Log.txt")
 
+@functools.lru_cache(maxsize=64)
 def parse_version_to_tuple(version_str):
     if not version_str or "Unknown" in version_str:
         return (0, 0, 0)
     
-    clean_str = re.sub(r'[^0-9\.]', '', version_str)
+    clean_str = _RE_NONVER.sub('', version_str)
     parts = clean_str.split('.')
     try:
         return tuple(map(int, parts))
     except ValueError:
         return (0, 0, 0)
 
+def find_dir_containing(root_dir, filename):
+    """ Depth-first os.scandir search; returns the first directory holding filename. """
+    stack = [root_dir]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name == filename and entry.is_file():
+                    return current
+        stack.extend(reversed(subdirs))
+    return None
+
+def copy_entry(entry, dest_dir):
+    """ Copies a single os.DirEntry (file or directory tree) into dest_dir. """
+    dest = os.path.join(dest_dir, entry.name)
+    if entry.is_dir(follow_symlinks=False):
+        shutil.copytree(entry.path, dest, dirs_exist_ok=True)
+    else:
+        shutil.copy2(entry.path, dest)
+
 # ----------------- LOGGING CLASS -----------------
+class _ConsoleHandler(logging.Handler):
+    """ Runs on the listener thread: stdout, log buffer and UI queue. """
+    def __init__(self, logger):
+        super().__init__()
+        self.logger = logger
+
+    def emit(self, record):
+        message = record.getMessage()
+        print(f"[{record.levelname}] {message}")
+        
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+        formatted_msg = f"[{timestamp}] {message}\n"
+        
+        # Buffer and queue change together, so show_console sees a line in exactly one of them
+        with self.logger.buffer_lock:
+            self.logger.log_buffer.append(formatted_msg)
+            # Picked up in batches by the UI thread (see FirefoxManagerApp._drain_log_queue)
+            self.logger.ui_queue.put(formatted_msg)
+
 class Logger:
-    def __init__(self, log_file, ui_callback=None):
+    def __init__(self, log_file):
         self.log_file = log_file
-        self.ui_callback = ui_callback
-        self.log_buffer = []  # Buffer for early logs
-        logging.basicConfig(filename=self.log_file, level=logging.INFO,
-                            format='%(asctime)s - %(levelname)s - %(message)s', force=True)
+        self.ui_queue = queue.Queue()
+        self.log_buffer = collections.deque(maxlen=2000)  # Buffer for early logs (most recent only)
+        self.buffer_lock = threading.Lock()
+
+        # Callers only enqueue records; file/console I/O happens on the listener thread
+        self.log_queue = queue.Queue()
+        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        queue_handler = logging.handlers.QueueHandler(self.log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+        self.listener = logging.handlers.QueueListener(self.log_queue, file_handler, _ConsoleHandler(self))
+        self.listener.start()
 
     def log(self, message, level="info"):
-        if level == "info": logging.info(message)
-        elif level == "error": logging.error(message)
+        if level == "error": logging.error(message)
         elif level == "warning": logging.warning(message)
-        
-        print(f"[{level.upper()}] {message}")
-        
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_msg = f"[{timestamp}] {message}\n"
-        
-        # Save to buffer
-        self.log_buffer.append(formatted_msg)
-        
-        if self.ui_callback:
-            self.ui_callback(formatted_msg)
+        else: logging.info(message)
+
+    def stop(self):
+        # Flushes pending records
+        self.listener.stop()
 
 # ----------------- GUI CLASS -----------------
+@dataclass
+class VersionRow:
+    # Manual __slots__: dataclass(slots=True) would require Python 3.10
+    __slots__ = ('lbl_ver', 'btn_start', 'btn_update', 'btn_delete')
+    lbl_ver: ttk.Label
+    btn_start: ttk.Button
+    btn_update: ttk.Button
+    btn_delete: ttk.Button
+
 class FirefoxManagerApp:
     def __init__(self, root):
         self.root = root
         self.base_dir = get_base_dir()
         self.config = configparser.ConfigParser()
         self.load_config()
+        self._rebuild_paths()
         
         self.console_window = None
         self.console_text_widget = None
 
-        self.logger = Logger(get_log_path(), self.log_to_console)
+        # Version cache: path -> (mtime_ns, size, version)
+        self._ver_cache = {}
+
+        # Startup and manual checks never run their lookups at the same time;
+        # a manual check cancels a startup check that has not sent its lookups yet, which is re-run afterwards
+        self._check_lock = threading.Lock()
+        self._check_cancel = threading.Event()
+        self._recheck_needed = False
+
+        self.logger = Logger(get_log_path())
+        self.root.after(LOG_POLL_MS, self._drain_log_queue)
+
+        # Shared HTTP session: keep-alive connections to download.mozilla.org are reused
+        self.http = requests.Session()
+        self.http.headers.update({"User-Agent": "FirefoxPortableManager/3.4"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=1, backoff_factor=0))
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
 
         self.root.title("Firefox Portable Manager 3.4")
         self.apply_window_geometry()
@@ -176,7 +272,7 @@ class FirefoxManagerApp:
 
         self.check_cli_args()
         
-        self.logger.log(f"Base Directory: {self.config.get('GENERAL', 'BaseDir')}")
+        self.logger.log(f"Base Directory: {self._cfg['BaseDir']}")
         self.refresh_versions_ui()
         self.root.after(2000, self.startup_update_check)
 
@@ -199,29 +295,77 @@ class FirefoxManagerApp:
 
     def load_config(self):
         cfg_path = get_config_path()
-        if not os.path.exists(cfg_path):
+        is_new = not os.path.exists(cfg_path)
+        if is_new:
             self.config['GENERAL'] = {
                 'BaseDir': self.base_dir,
                 '7ZipPath': self.find_7zip(),
                 'WindowGeo': '750x500'
             }
             self.config['HELP'] = {'Text': DEFAULT_HELP_TEXT}
-            self.save_config()
         else:
             self.config.read(cfg_path, encoding='utf-8')
 
+        # Plain dict snapshot: lookups on hot paths avoid configparser overhead
+        self._cfg = {
+            'BaseDir': self.config.get('GENERAL', 'BaseDir', fallback=self.base_dir),
+            '7ZipPath': self.config.get('GENERAL', '7ZipPath', fallback=''),
+            'WindowGeo': self.config.get('GENERAL', 'WindowGeo', fallback='750x500'),
+            'HelpText': self.config.get('HELP', 'Text', fallback=DEFAULT_HELP_TEXT)
+        }
+
+        # Remote version cache: url -> (version, timestamp), stored per channel as "version;timestamp"
+        self._remote_cache = {}
+        for name, url in DEFAULT_URLS.items():
+            try:
+                ver, ts = self.config.get('CACHE', name, fallback='').split(';')
+                self._remote_cache[url] = (ver, float(ts))
+            except ValueError:
+                pass # No or malformed entry
+
+        self._cfg_last_saved = None if is_new else self._config_state()
+        if is_new:
+            self.save_config()
+
+    def _config_state(self):
+        return (dict(self._cfg), dict(self._remote_cache))
+
     def save_config(self):
-        with open(get_config_path(), 'w', encoding='utf-8') as f:
+        # Skip the disk write if nothing changed since the last save
+        state = self._config_state()
+        if state == self._cfg_last_saved:
+            return
+        self.config.read_dict({
+            'GENERAL': {
+                'BaseDir': self._cfg['BaseDir'],
+                '7ZipPath': self._cfg['7ZipPath'],
+                'WindowGeo': self._cfg['WindowGeo']
+            },
+            'HELP': {'Text': self._cfg['HelpText']}
+        })
+        self.config['CACHE'] = {
+            name: f"{self._remote_cache[url][0]};{self._remote_cache[url][1]:.0f}"
+            for name, url in DEFAULT_URLS.items() if url in self._remote_cache
+        }
+        # Write to a temp file and swap it in, so a crash never leaves a half-written ini
+        cfg_path = get_config_path()
+        tmp_path = cfg_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             self.config.write(f)
+        os.replace(tmp_path, cfg_path)
+        self._cfg_last_saved = state
 
     def find_7zip(self):
-        candidates = [r"C:\Program Files\7-Zip\7z.exe", r"C:\Program Files (x86)\7-Zip\7z.exe", "7z.exe"]
+        # PATH lookup once, then the default install folders
+        on_path = shutil.which("7z") or shutil.which("7z.exe")
+        if on_path: return on_path
+        candidates = [r"C:\Program Files\7-Zip\7z.exe", r"C:\Program Files (x86)\7-Zip\7z.exe"]
         for c in candidates:
-            if os.path.exists(c) or shutil.which("7z"): return c
+            if os.path.exists(c): return c
         return ""
 
     def apply_window_geometry(self):
-        geo = self.config.get('GENERAL', 'WindowGeo', fallback='750x500')
+        geo = self._cfg['WindowGeo']
         self.root.geometry(geo)
 
     def create_version_row(self, parent, name, row):
@@ -243,12 +387,12 @@ class FirefoxManagerApp:
         btn_update.pack(side=tk.LEFT, padx=2)
         btn_del.pack(side=tk.LEFT, padx=2)
 
-        self.version_widgets[name] = {
-            'lbl_ver': lbl_ver,
-            'btn_start': btn_start,
-            'btn_update': btn_update,
-            'btn_delete': btn_del
-        }
+        self.version_widgets[name] = VersionRow(
+            lbl_ver=lbl_ver,
+            btn_start=btn_start,
+            btn_update=btn_update,
+            btn_delete=btn_del
+        )
 
     # ----------------- CONSOLE -----------------
 
@@ -264,11 +408,17 @@ class FirefoxManagerApp:
             btn_clear = ttk.Button(self.console_window, text="Clear", command=self.clear_console)
             btn_clear.pack(side=tk.BOTTOM, fill=tk.X)
             
-            # Show buffered logs
-            if self.logger.log_buffer:
+            # Show buffered logs; pending queue lines are already part of the buffer
+            with self.logger.buffer_lock:
+                try:
+                    while True: self.logger.ui_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                history = "".join(self.logger.log_buffer)
+            if history:
                 self.console_text_widget.config(state='normal')
-                for msg in self.logger.log_buffer:
-                    self.console_text_widget.insert(tk.END, msg)
+                # One insert for the whole history instead of one per line
+                self.console_text_widget.insert(tk.END, history)
                 self.console_text_widget.see(tk.END)
                 self.console_text_widget.config(state='disabled')
         else:
@@ -280,8 +430,17 @@ class FirefoxManagerApp:
             self.console_text_widget.delete(1.0, tk.END)
             self.console_text_widget.config(state='disabled')
 
-    def log_to_console(self, msg):
-        self.root.after(0, lambda: self._append_log_text(msg))
+    def _drain_log_queue(self):
+        # Polled from the UI thread: one Text update per batch instead of one after() per line
+        batch = []
+        try:
+            while len(batch) < 500:
+                batch.append(self.logger.ui_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self._append_log_text("".join(batch))
+        self.root.after(LOG_POLL_MS, self._drain_log_queue)
 
     def _append_log_text(self, msg):
         if self.console_window and tk.Toplevel.winfo_exists(self.console_window) and self.console_text_widget:
@@ -292,31 +451,65 @@ class FirefoxManagerApp:
 
     # ----------------- STATUS & PATHS -----------------
 
+    def _rebuild_paths(self):
+        """ 
+        Precomputes (version_dir, exe_path, profile_path) per version.
+        Must be called again whenever BaseDir changes.
+        """
+        base = self._cfg['BaseDir']
+        self._paths = {}
+        for name in DEFAULT_URLS:
+            # Fix: Enforce absolute paths
+            version_dir = os.path.abspath(os.path.join(base, name))
+            self._paths[name] = (
+                version_dir,
+                os.path.join(version_dir, "core", "firefox.exe"),
+                os.path.join(version_dir, "profile")
+            )
+
     def get_version_dir(self, name):
-        base = self.config.get('GENERAL', 'BaseDir', fallback=self.base_dir)
-        # Fix: Enforce absolute paths
-        return os.path.abspath(os.path.join(base, name))
+        return self._paths[name][0]
 
     def get_exe_path(self, name):
-        return os.path.join(self.get_version_dir(name), "core", "firefox.exe")
+        return self._paths[name][1]
 
     def get_profile_path(self, name):
-        return os.path.join(self.get_version_dir(name), "profile")
+        return self._paths[name][2]
 
     def check_cli_args(self):
         if len(sys.argv) > 1: self.cli_files = sys.argv[1:]
         else: self.cli_files = []
 
+    def _scan_installed(self):
+        """ 
+        Returns {name: exe_path} for all installed versions.
+        One os.scandir of the base directory instead of probing every version path.
+        """
+        installed = {}
+        names = {n.lower(): n for n in DEFAULT_URLS}
+        try:
+            with os.scandir(os.path.abspath(self._cfg['BaseDir'])) as it:
+                for entry in it:
+                    name = names.get(entry.name.lower())
+                    if name and entry.is_dir():
+                        exe = self.get_exe_path(name)
+                        if os.path.isfile(exe):
+                            installed[name] = exe
+        except OSError:
+            pass # Base directory missing -> nothing installed
+        return installed
+
     def refresh_versions_ui(self):
         """ 
         Updates the UI based on local status.
         Runs immediately at startup.
         """
+        self._installed = self._scan_installed()
         for name in DEFAULT_URLS.keys():
-            exe = self.get_exe_path(name)
+            exe = self._installed.get(name)
             widgets = self.version_widgets[name]
             
-            if os.path.exists(exe):
+            if exe:
                 ver = self.get_file_version(exe)
                 if ver == "Unknown":
                     ver_text = "Installed (Ver.?)"
@@ -324,60 +517,108 @@ class FirefoxManagerApp:
                     ver_text = f"{ver} (Checking...)"
                 
                 # Set to "Checking" status (blue) until Auto-Check completes
-                widgets['lbl_ver'].config(text=ver_text, style="Checking.TLabel")
-                widgets['btn_start'].state(['!disabled'])
-                widgets['btn_delete'].state(['!disabled'])
+                widgets.lbl_ver.config(text=ver_text, style="Checking.TLabel")
+                widgets.btn_start.state(['!disabled'])
+                widgets.btn_delete.state(['!disabled'])
             else:
-                widgets['lbl_ver'].config(text="Not installed", style="Missing.TLabel")
-                widgets['btn_start'].state(['disabled'])
-                widgets['btn_delete'].state(['disabled'])
+                widgets.lbl_ver.config(text="Not installed", style="Missing.TLabel")
+                widgets.btn_start.state(['disabled'])
+                widgets.btn_delete.state(['disabled'])
 
     def get_file_version(self, path):
         """ 
         Attempts to read version.
         Method 1: application.ini (reliable for Firefox)
         Method 2: Win32 API (Fallback)
+        Results are cached until the file's mtime or size changes.
         """
         # Method 1: read application.ini
         try:
             exe_dir = os.path.dirname(path)
             ini_path = os.path.join(exe_dir, "application.ini")
-            if os.path.exists(ini_path):
-                with open(ini_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    # Look for [App] ... Version=X.X.X
-                    match = re.search(r'Version=([0-9\.]+[a-z0-9]*)', content)
-                    if match:
-                        return match.group(1)
+            st = os.stat(ini_path)
+            cached = self._ver_cache.get(ini_path)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
+            # [App] section is at the top: read raw bytes, 2 KiB first, 4 KiB more only if needed
+            with open(ini_path, 'rb') as f:
+                content = f.read(2048)
+                start = content.find(b"\nVersion=")
+                # Key not seen yet, or its value runs across the block boundary
+                if start < 0 or content.find(b"\n", start + 1) < 0:
+                    content += f.read(4096)
+            # Look for [App] ... Version=X.X.X (line start, so MinVersion= etc. never match)
+            start = content.find(b"\nVersion=")
+            if start >= 0:
+                start += len(b"\nVersion=")
+                end = content.find(b"\n", start)
+                if end < 0 and len(content) < st.st_size:
+                    raise ValueError("Version value truncated") # Never return/cache a cut-off value
+                ver = content[start:end if end >= 0 else None].strip().decode('ascii')
+                if ver:
+                    self._ver_cache[ini_path] = (st.st_mtime_ns, st.st_size, ver)
+                    return ver
         except Exception:
             pass # Move to Method 2
 
         # Method 2: Win32 API
         try:
+            from win32api import GetFileVersionInfo, LOWORD, HIWORD
+            st = os.stat(path)
+            cached = self._ver_cache.get(path)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
             info = GetFileVersionInfo(path, "\\")
             ms = info['FileVersionMS']
             ls = info['FileVersionLS']
-            return f"{HIWORD(ms)}.{LOWORD(ms)}.{HIWORD(ls)}.{LOWORD(ls)}"
+            ver = f"{HIWORD(ms)}.{LOWORD(ms)}.{HIWORD(ls)}.{LOWORD(ls)}"
+            self._ver_cache[path] = (st.st_mtime_ns, st.st_size, ver)
+            return ver
         except Exception:
             pass
             
         return "Unknown"
 
+    def forget_file_version(self, name):
+        # 7-Zip restores archive timestamps, so don't rely on mtime alone after install/delete
+        exe = self.get_exe_path(name)
+        self._ver_cache.pop(exe, None)
+        self._ver_cache.pop(os.path.join(os.path.dirname(exe), "application.ini"), None)
+
     # ----------------- AUTO-CHECK -----------------
 
     def startup_update_check(self):
-        t = threading.Thread(target=self.run_startup_check)
+        t = threading.Thread(target=self.run_startup_check, args=(self._installed,))
         t.daemon = True
         t.start()
 
-    def run_startup_check(self):
+    def resume_startup_check(self):
+        # Re-run a startup check that was cancelled by a manual check (remote results are cached by now)
+        if self._recheck_needed:
+            self._recheck_needed = False
+            self.root.after(0, self.startup_update_check)
+
+    def run_startup_check(self, installed=None):
+        with self._check_lock:
+            self._run_startup_check(installed)
+
+    def _run_startup_check(self, installed):
         self.logger.log("Starting auto-update check...", "info")
         updates_found = 0
-        
+        if installed is None:
+            installed = self._scan_installed()
+
+        # Collect local state first, network lookups run in parallel afterwards
+        pending = []
         for name, url in DEFAULT_URLS.items():
-            exe_path = self.get_exe_path(name)
+            if self._check_cancel.is_set():
+                self.logger.log("[CHECK] Auto-check cancelled by manual check", "info")
+                self._recheck_needed = True
+                return
+
+            exe_path = installed.get(name)
             
-            if not os.path.exists(exe_path):
+            if not exe_path:
                 self.logger.log(f"[CHECK] {name}: Not installed", "info")
                 continue
 
@@ -390,21 +631,30 @@ class FirefoxManagerApp:
                  self.root.after(0, lambda n=name: self.mark_uptodate(n, "Installed (Ver.?)"))
                  continue
 
-            remote_str = self.get_remote_version_info(url)
-            self.logger.log(f"[CHECK] {name}: Remote Version = {remote_str}", "info")
-            
-            if not remote_str:
-                self.logger.log(f"[CHECK] {name}: No internet, marking as current", "info")
-                self.root.after(0, lambda n=name, l=local_str: self.mark_uptodate(n, l))
-                continue
+            pending.append((name, url, exe_path, local_str))
 
-            if self.check_is_newer(local_str, remote_str):
-                updates_found += 1
-                self.logger.log(f"[CHECK] {name}: Update available!", "info")
-                self.root.after(0, lambda n=name, l=local_str: self.mark_update_available(n, l))
-            else:
-                self.logger.log(f"[CHECK] {name}: Is up to date", "info")
-                self.root.after(0, lambda n=name, l=local_str: self.mark_uptodate(n, l))
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as ex:
+                futures = {ex.submit(self.get_remote_version_info, url): (name, local_str)
+                           for name, url, exe_path, local_str in pending}
+
+                for future in as_completed(futures):
+                    name, local_str = futures[future]
+                    remote_str = future.result()
+                    self.logger.log(f"[CHECK] {name}: Remote Version = {remote_str}", "info")
+                    
+                    if not remote_str:
+                        self.logger.log(f"[CHECK] {name}: No internet, marking as current", "info")
+                        self.root.after(0, lambda n=name, l=local_str: self.mark_uptodate(n, l))
+                        continue
+
+                    if self.check_is_newer(local_str, remote_str):
+                        updates_found += 1
+                        self.logger.log(f"[CHECK] {name}: Update available!", "info")
+                        self.root.after(0, lambda n=name, l=local_str: self.mark_update_available(n, l))
+                    else:
+                        self.logger.log(f"[CHECK] {name}: Is up to date", "info")
+                        self.root.after(0, lambda n=name, l=local_str: self.mark_uptodate(n, l))
 
         if updates_found > 0:
             self.root.after(0, lambda: self.status_var.set(f"{updates_found} Update(s) found."))
@@ -412,7 +662,7 @@ class FirefoxManagerApp:
             self.root.after(0, lambda: self.status_var.set("All installations up to date."))
 
     def mark_update_available(self, name, local_ver):
-        lbl = self.version_widgets[name]['lbl_ver']
+        lbl = self.version_widgets[name].lbl_ver
         # Remove "(Checking...)" if present
         clean_ver = local_ver.replace(" (Checking...)", "")
         
@@ -422,12 +672,11 @@ class FirefoxManagerApp:
             style="Update.TLabel",
             foreground="#CC0000"
         )
-        lbl.update_idletasks()
         
         self.logger.log(f"[UI] {name} marked as update available: {clean_ver}", "info")
 
     def mark_uptodate(self, name, local_ver):
-        lbl = self.version_widgets[name]['lbl_ver']
+        lbl = self.version_widgets[name].lbl_ver
         # Remove "(Checking...)" if present
         clean_ver = local_ver.replace(" (Checking...)", "")
         
@@ -437,7 +686,6 @@ class FirefoxManagerApp:
             style="Installed.TLabel",
             foreground="#008000"
         )
-        lbl.update_idletasks()
         
         self.logger.log(f"[UI] {name} marked as up to date: {clean_ver}", "info")
 
@@ -455,10 +703,17 @@ class FirefoxManagerApp:
     # ----------------- UPDATE PROCESS -----------------
 
     def get_remote_version_info(self, url):
+        now = time.time()
+        cached = self._remote_cache.get(url)
+        if cached and now - cached[1] < REMOTE_CACHE_TTL:
+            return cached[0]
         try:
-            r = requests.head(url, allow_redirects=True, timeout=5)
-            match = re.search(r'/releases/([0-9]+\.[0-9]+([a-z0-9\.]+)?)', r.url)
-            if match: return match.group(1)
+            r = self.http.head(url, allow_redirects=True, timeout=CHECK_TIMEOUT)
+            match = _RE_RELEASE.search(r.url)
+            if match:
+                # Only successful lookups are cached, offline results are retried
+                self._remote_cache[url] = (match.group(1), now)
+                return match.group(1)
             return None
         except Exception:
             return None
@@ -479,7 +734,12 @@ class FirefoxManagerApp:
             local_ver = self.get_file_version(exe_path)
             
         self.update_status(f"Checking online version for {name}...")
-        remote_ver = self.get_remote_version_info(url)
+        # Stop a startup check before it sends lookups, or wait for the ones in flight (they fill the remote cache)
+        self._check_cancel.set()
+        with self._check_lock:
+            # Cleared only here: the startup check has either seen the cancel or already finished
+            self._check_cancel.clear()
+            remote_ver = self.get_remote_version_info(url)
         self.set_busy(False)
 
         should_install = False
@@ -512,12 +772,13 @@ class FirefoxManagerApp:
             t.start()
         else:
             self.update_status("Cancelled.")
+            self.resume_startup_check()
 
     def run_download_install_process(self, name, url):
         try:
             self.logger.log(f"--- Starting Installation: {name} ---")
             
-            seven_zip = self.config.get('GENERAL', '7ZipPath')
+            seven_zip = self._cfg['7ZipPath']
             if not seven_zip or (not os.path.exists(seven_zip) and not shutil.which("7z")):
                 raise Exception("7-Zip path invalid!")
 
@@ -526,10 +787,16 @@ class FirefoxManagerApp:
             os.makedirs(temp_dir, exist_ok=True)
             installer_path = os.path.join(temp_dir, f"firefox_{name}.exe")
             
-            r = requests.get(url, stream=True)
-            r.raise_for_status()
-            with open(installer_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192): f.write(chunk)
+            with self.http.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as r:
+                r.raise_for_status()
+                # Installer is a 7z SFX, so 7-Zip needs it on disk; copy raw stream in large blocks
+                r.raw.decode_content = True
+                with open(installer_path, "wb") as f:
+                    size = r.headers.get('Content-Length', '')
+                    if size.isdigit():
+                        f.truncate(int(size)) # Preallocate
+                    shutil.copyfileobj(r.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                    f.truncate() # Trim in case the body differs from Content-Length
             
             self.logger.log("Download complete.")
 
@@ -537,46 +804,66 @@ class FirefoxManagerApp:
             version_dir = self.get_version_dir(name)
             core_dir = os.path.join(version_dir, "core")
             
-            if os.path.exists(core_dir):
+            # Old cores whose background delete was cut short by closing the app
+            if os.path.isdir(version_dir):
+                with os.scandir(version_dir) as it:
+                    for entry in it:
+                        if entry.name.startswith("core_bak_") and entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path, ignore_errors=True)
+
+            backup_dir = core_dir + "_bak"
+            if os.path.isfile(os.path.join(core_dir, "firefox.exe")):
                 try:
-                    shutil.move(core_dir, core_dir + "_bak")
+                    # core is the current install, so any older core_bak is obsolete
+                    if os.path.exists(backup_dir): shutil.rmtree(backup_dir)
+                    # Same-volume rename: instant regardless of tree size
+                    os.replace(core_dir, backup_dir)
                 except Exception as e:
                     self.logger.log(f"Backup failed (Firefox open?): {e}", "error")
                     raise
+            elif os.path.exists(core_dir):
+                # Leftover of a failed install: core_bak (if any) is the last good Firefox, keep it
+                self.logger.log(f"Removing incomplete core, keeping {backup_dir}.", "warning")
+                shutil.rmtree(core_dir)
             
-            os.makedirs(core_dir, exist_ok=True)
-            extract_temp = os.path.join(temp_dir, "extracted")
-            if os.path.exists(extract_temp): shutil.rmtree(extract_temp)
-
-            cmd = [seven_zip, "x", installer_path, f"-o{extract_temp}", "-y"]
-            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-            found_exe = False
-            for root, dirs, files in os.walk(extract_temp):
-                if "firefox.exe" in files:
-                    source_dir = root
-                    self.logger.log(f"Firefox found in: {source_dir}")
-                    
-                    for item in os.listdir(source_dir):
-                        s = os.path.join(source_dir, item)
-                        d = os.path.join(core_dir, item)
-                        if os.path.isdir(s):
-                            shutil.copytree(s, d, dirs_exist_ok=True)
-                        else:
-                            shutil.copy2(s, d)
-                    found_exe = True
-                    break
-            
-            if not found_exe:
-                raise Exception("firefox.exe could not be found in installer!")
+            os.makedirs(version_dir, exist_ok=True)
+
+            # Full installers keep Firefox under core\ -> extract only that, straight into the version folder
+            cmd = [seven_zip, "x", installer_path, "core", f"-o{version_dir}", "-y", "-aoa"]
+            # No console window flash for 7z.exe
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT,
+                                    creationflags=subprocess.CREATE_NO_WINDOW)
+            if result.returncode != 0:
+                # Partial extraction (disk full, locked file, corrupt archive): never keep a broken core
+                shutil.rmtree(core_dir, ignore_errors=True)
+                raise Exception(f"7-Zip extraction failed (exit code {result.returncode})!")
+
+            if not os.path.isfile(self.get_exe_path(name)):
+                self.logger.log("No core folder in installer, falling back to full extraction.", "warning")
+                self._extract_staged(seven_zip, installer_path, temp_dir, core_dir)
 
             shutil.rmtree(temp_dir, ignore_errors=True)
-            if os.path.exists(core_dir + "_bak"): shutil.rmtree(core_dir + "_bak", ignore_errors=True)
+            if os.path.exists(backup_dir):
+                # Delete the old core in the background, the Success message should not wait for it
+                stale_dir = f"{backup_dir}_{int(time.time())}"
+                try:
+                    os.replace(backup_dir, stale_dir)
+                    threading.Thread(target=shutil.rmtree, args=(stale_dir,),
+                                     kwargs={'ignore_errors': True}, daemon=True).start()
+                except OSError as e:
+                    # Cleanup must never fail a finished install (e.g. virus scanner holding a file);
+                    # delete what we can now so no stale core_bak is left behind
+                    self.logger.log(f"Could not move old backup {backup_dir}, deleting it now: {e}", "warning")
+                    shutil.rmtree(backup_dir, ignore_errors=True)
 
             profile_dir = self.get_profile_path(name)
             os.makedirs(profile_dir, exist_ok=True)
             self.create_shortcut(name)
 
+            # Next check for this channel asks the server again and re-reads the local version
+            self._remote_cache.pop(url, None)
+            self.forget_file_version(name)
+
             self.logger.log(f"--- {name} successfully installed ---")
             self.root.after(0, lambda: messagebox.showinfo("Success", f"{name} installed."))
             
@@ -587,6 +874,36 @@ class FirefoxManagerApp:
         finally:
             self.root.after(0, self.set_busy, False)
             self.root.after(0, self.refresh_versions_ui)
+            self.resume_startup_check()
+
+    def _extract_staged(self, seven_zip, installer_path, temp_dir, core_dir):
+        """ 
+        Fallback for unknown installer layouts:
+        extracts everything, searches for firefox.exe and moves that folder to core_dir.
+        """
+        extract_temp = os.path.join(temp_dir, "extracted")
+        if os.path.exists(extract_temp): shutil.rmtree(extract_temp)
+
+        cmd = [seven_zip, "x", installer_path, f"-o{extract_temp}", "-y"]
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT,
+                       creationflags=subprocess.CREATE_NO_WINDOW)
+
+        source_dir = find_dir_containing(extract_temp, "firefox.exe")
+        if not source_dir:
+            raise Exception("firefox.exe could not be found in installer!")
+        self.logger.log(f"Firefox found in: {source_dir}")
+
+        # Files are already unpacked in the right shape: rename instead of copying
+        shutil.rmtree(core_dir, ignore_errors=True)
+        try:
+            os.replace(source_dir, core_dir)
+        except OSError:
+            # Different volume (e.g. BaseDir on another drive): copy top-level entries in parallel
+            os.makedirs(core_dir, exist_ok=True)
+            with os.scandir(source_dir) as it:
+                entries = list(it)
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                list(ex.map(lambda e: copy_entry(e, core_dir), entries))
 
     # ----------------- DELETE & START -----------------
 
@@ -601,8 +918,9 @@ class FirefoxManagerApp:
             self.logger.log(f"Deleting {name}...")
             ver_dir = self.get_version_dir(name)
             if os.path.exists(ver_dir): shutil.rmtree(ver_dir)
+            self.forget_file_version(name)
             
-            lnk = os.path.join(self.config.get('GENERAL', 'BaseDir'), f"Firefox Portable {name}.lnk")
+            lnk = os.path.join(self._cfg['BaseDir'], f"Firefox Portable {name}.lnk")
             if os.path.exists(lnk): os.remove(lnk)
 
             self.refresh_versions_ui()
@@ -612,8 +930,10 @@ class FirefoxManagerApp:
 
     def create_shortcut(self, name):
         try:
+            import pythoncom
+            import win32com.client
             pythoncom.CoInitialize() 
-            base = self.config.get('GENERAL', 'BaseDir')
+            base = self._cfg['BaseDir']
             lnk = os.path.join(base, f"Firefox Portable {name}.lnk")
             exe = self.get_exe_path(name)
             prof = self.get_profile_path(name)
@@ -638,7 +958,10 @@ class FirefoxManagerApp:
             self.cli_files = []
         
         try:
-            subprocess.Popen(cmd)
+            # Fully detached: no console, no inherited handles, survives the manager exiting
+            subprocess.Popen(cmd, creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                             close_fds=True, stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             self.status_var.set(f"{name} started.")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -659,14 +982,25 @@ class FirefoxManagerApp:
         self.root.after(0, lambda: self.status_var.set(text))
 
     def open_settings(self):
-        SettingsDialog(self.root, self.config, self.save_config)
+        old_base = self._cfg['BaseDir']
+        SettingsDialog(self.root, self._cfg, lambda: self.on_settings_saved(old_base))
+
+    def on_settings_saved(self, old_base):
+        self.save_config()
+        if self._cfg['BaseDir'] == old_base:
+            return
+        # Other install folder: rescan and re-check (remote versions come from the cache)
+        self._rebuild_paths()
+        self.refresh_versions_ui()
+        self.startup_update_check()
 
     def show_help(self):
-        HelpDialog(self.root, self.config.get('HELP', 'Text'))
+        HelpDialog(self.root, self._cfg['HelpText'])
 
     def on_close(self):
-        self.config['GENERAL']['WindowGeo'] = self.root.geometry()
+        self._cfg['WindowGeo'] = self.root.geometry()
         self.save_config()
+        self.logger.stop()
         self.root.destroy()
         sys.exit(0)
 
@@ -689,13 +1023,13 @@ class SettingsDialog(tk.Toplevel):
         ttk.Label(self, text="Base Directory:").pack(anchor="w", padx=10, pady=(10,0))
         self.entry_base = ttk.Entry(self)
         self.entry_base.pack(fill=tk.X, padx=10, pady=2)
-        self.entry_base.insert(0, config.get('GENERAL', 'BaseDir'))
+        self.entry_base.insert(0, config['BaseDir'])
         ttk.Button(self, text="Browse", command=self.browse_base).pack(anchor="e", padx=10)
 
         ttk.Label(self, text="7-Zip Path (7z.exe):").pack(anchor="w", padx=10, pady=(10,0))
         self.entry_7z = ttk.Entry(self)
         self.entry_7z.pack(fill=tk.X, padx=10, pady=2)
-        self.entry_7z.insert(0, config.get('GENERAL', '7ZipPath'))
+        self.entry_7z.insert(0, config['7ZipPath'])
         ttk.Button(self, text="Browse", command=self.browse_7z).pack(anchor="e", padx=10)
 
         f = ttk.Frame(self)
@@ -712,8 +1046,8 @@ class SettingsDialog(tk.Toplevel):
         if f: self.entry_7z.delete(0, tk.END); self.entry_7z.insert(0, f)
 
     def save(self):
-        self.config['GENERAL']['BaseDir'] = self.entry_base.get()
-        self.config['GENERAL']['7ZipPath'] = self.entry_7z.get()
+        self.config['BaseDir'] = self.entry_base.get()
+        self.config['7ZipPath'] = self.entry_7z.get()
         self.save_cb()
         self.destroy()
 